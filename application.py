@@ -1,7 +1,7 @@
 import datetime
 import json
 
-from contract import Contract, PrepaidContract, MTMContract, TermContract
+from contract import PrepaidContract, MTMContract, TermContract
 from customer import Customer
 from phoneline import PhoneLine
 from visualizer import Visualizer
@@ -32,10 +32,6 @@ def create_customers(log: dict[str, list[dict]]) -> list[Customer]:
     for cust in log['customers']:
         customer = Customer(cust['id'])
         for line in cust['lines']:
-            contract = Contract(datetime.datetime.now())
-            contract.new_month = lambda *args: None
-            contract.bill_call = lambda *args: None
-
             contract = None
             if line['contract'] == 'prepaid':
                 # start with $100 credit on the account
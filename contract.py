@@ -1,5 +1,4 @@
 import datetime
-from math import ceil
 from typing import Optional
 from bill import Bill
 from call import Call
@@ -36,6 +35,7 @@ class Contract:
          bill for this contract for the last month of call records loaded from
          the input dataset
     """
+    __slots__ = ('start', 'bill')
     start: datetime.date
     bill: Optional[Bill]
 
@@ -63,7 +63,8 @@ class Contract:
         was made. In other words, you can safely assume that self.bill has been
         already advanced to the right month+year.
         """
-        self.bill.add_billed_minutes(ceil(call.duration / 60.0))
+        bill = self.bill
+        bill.add_billed_minutes(-(-call.duration // 60))
 
     def cancel_contract(self) -> float:
         """ Return the amount owed in order to close the phone line associated
@@ -81,8 +82,7 @@ class Contract:
 class MTMContract(Contract):
     """ Contract with no end date, no initial term deposit, and no free minutes.
     """
-    start: datetime.date
-    bill: Optional[Bill]
+    __slots__ = ()
 
     def new_month(self, month: int, year: int, bill: Bill) -> None:
         """
@@ -111,10 +111,16 @@ class TermContract(Contract):
     === Representation Invariants ===
     end > start
     """
-    start: datetime.date
-    bill: Optional[Bill]
+    # === Private Attributes ===
+    # _deposit_applied:
+    #     tracks if the term deposit has been added to a bill.
+    # _free_remaining:
+    #     free minutes still available on the current month's bill.
+    __slots__ = ('end', 'commit', '_deposit_applied', '_free_remaining')
     end: datetime.date
     commit: bool
+    _deposit_applied: bool
+    _free_remaining: int
 
     def __init__(self, start: datetime.date, end: datetime.date) -> None:
         """Create a TermContract with an <end> date and
@@ -124,6 +130,8 @@ class TermContract(Contract):
         Contract.__init__(self, start)
         self.end = end
         self.commit = False
+        self._deposit_applied = False
+        self._free_remaining = 0
 
     def new_month(self, month: int, year: int, bill: Bill) -> None:
         """Advance to a new month in the contract, corresponding to <month>
@@ -133,13 +141,17 @@ class TermContract(Contract):
         -If <month> and <year> match the <end> date’s
         month and year, set <commit> to True.
         """
-        if self.start.month == month and self.start.year == year:
+        if not self._deposit_applied and \
+                (self.start.month, self.start.year) == (month, year):
             bill.add_fixed_cost(TERM_DEPOSIT)
+            self._deposit_applied = True
 
-        if month == self.end.month and year == self.end.year:
+        if not self.commit and \
+                (self.end.month, self.end.year) == (month, year):
             self.commit = True
 
         self.bill = bill
+        self._free_remaining = TERM_MINS - bill.free_min
         bill.set_rates("TERM", TERM_MINS_COST)
         bill.add_fixed_cost(TERM_MONTHLY_FEE)
 
@@ -169,15 +181,17 @@ class TermContract(Contract):
         was made. In other words, you can safely assume that self.bill has been
         already advanced to the right month+year.
         """
-        free = TERM_MINS - self.bill.free_min
-        call_duration = ceil(call.duration / 60.0)
+        bill = self.bill
+        call_duration = -(-call.duration // 60)
+        free = self._free_remaining
+
+        if free:
+            used_free = call_duration if call_duration < free else free
+            bill.add_free_minutes(used_free)
+            self._free_remaining = free - used_free
+            call_duration -= used_free
 
-        if free > 0:
-            used_free = min(call_duration, free)
-            self.bill.add_free_minutes(used_free)
-            self.bill.add_billed_minutes(call_duration - used_free)
-        else:
-            self.bill.add_billed_minutes(call_duration)
+        bill.add_billed_minutes(call_duration)
 
 
 class PrepaidContract(Contract):
@@ -188,8 +202,7 @@ class PrepaidContract(Contract):
     balance:
         A balance on account associated with this contract.
     """
-    start: datetime.date
-    bill: Optional[Bill]
+    __slots__ = ('balance',)
     balance: float
 
     def __init__(self, start: datetime.date, balance: float) -> None:
@@ -231,10 +244,10 @@ class PrepaidContract(Contract):
         is being cancelled. In other words, you can safely assume that self.bill
         exists for the right month+year when the cancellation is requested.
         """
-        self.start = None
         cost = self.bill.get_cost()
-        if self.bill.get_cost() < 0:
+        if cost < 0:
             cost = 0
+        self.start = None
         self.balance = 0
         return cost
 
@@ -244,7 +257,7 @@ if __name__ == '__main__':
 
     python_ta.check_all(config={
         'allowed-import-modules': [
-            'python_ta', 'typing', 'datetime', 'bill', 'call', 'math'
+            'python_ta', 'typing', 'datetime', 'bill', 'call'
         ],
         'disable': ['R0902', 'R0913'],
         'generated-members': 'pygame.*'